@@ -4,24 +4,29 @@ Suno Data Migration Pipeline
 ETL pipeline to migrate legacy EMR data to Suno's target schema
 """
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 import sqlite3
 import json
 import uuid
 import hashlib
-from datetime import datetime
 import os
-from typing import List, Dict, Any
+import shutil
+from typing import List, Dict, Any, Optional
 from pydantic import ValidationError
 import logging
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 
-from models import PatientModel, EncounterModel, InvoiceModel
-import warnings
+from models import PatientModel, EncounterModel, InvoiceModel, FRAME_VALIDATORS
 
-# Suppress SQLite adapter deprecation warnings for Python 3.12+
-warnings.filterwarnings("ignore", category=DeprecationWarning, message=".*adapter.*")
+# Bind dates and datetimes to SQLite as ISO-8601 text directly. These match
+# the values the deprecated default adapters (Python 3.12+) wrote, so the
+# export format is unchanged and no warning needs suppressing.
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
 
 
 # Set up logging
@@ -34,11 +39,20 @@ logger = logging.getLogger(__name__)
 def validate_referential_integrity(patients_df: pd.DataFrame, appointments_df: pd.DataFrame, invoices_df: pd.DataFrame) -> Dict[str, Any]:
     """Cross-table relationship validations with percentage-based metrics"""
     validations = {}
+
+    # Build the parent-key Index once; its lookup engine (hashtable) is cached
+    # on the Index and reused by every get_indexer call below
+    patient_index = pd.Index(patients_df['patient_uuid']).unique()
+    valid_invoice_refs = int((patient_index.get_indexer(invoices_df['patient_uuid']) != -1).sum())
+
+    # One hash pass over the appointment keys gives both the per-patient load
+    # (for the skew check) and, via its much smaller index, the valid references
+    appointments_per_patient = appointments_df.groupby('patient_uuid', sort=False, observed=True).size()
+    valid_appointment_refs = int(appointments_per_patient[patient_index.get_indexer(appointments_per_patient.index) != -1].sum())
     
     # Calculate appointment referential integrity percentage
     total_appointments = len(appointments_df)
     if total_appointments > 0:
-        valid_appointment_refs = int(appointments_df['patient_uuid'].isin(patients_df['patient_uuid']).sum())
         appointments_ref_percentage = round((valid_appointment_refs / total_appointments) * 100, 1)
         validations['appointments_reference_percentage'] = float(appointments_ref_percentage)
         validations['appointments_reference_patients'] = bool(appointments_ref_percentage >= 95.0)  # 95% threshold
@@ -49,7 +63,6 @@ def validate_referential_integrity(patients_df: pd.DataFrame, appointments_df: p
     # Calculate invoice referential integrity percentage  
     total_invoices = len(invoices_df)
     if total_invoices > 0:
-        valid_invoice_refs = int(invoices_df['patient_uuid'].isin(patients_df['patient_uuid']).sum())
         invoices_ref_percentage = round((valid_invoice_refs / total_invoices) * 100, 1)
         validations['invoices_reference_percentage'] = float(invoices_ref_percentage)
         validations['invoices_reference_patients'] = bool(invoices_ref_percentage >= 95.0)  # 95% threshold
@@ -57,13 +70,10 @@ def validate_referential_integrity(patients_df: pd.DataFrame, appointments_df: p
         validations['invoices_reference_percentage'] = 100.0
         validations['invoices_reference_patients'] = True
     
-    # Count orphaned records and calculate orphan percentage
-    orphaned_appointments = len(
-        appointments_df[~appointments_df['patient_uuid'].isin(patients_df['patient_uuid'])]
-    )
-    orphaned_invoices = len(
-        invoices_df[~invoices_df['patient_uuid'].isin(patients_df['patient_uuid'])]
-    )
+    # Count orphaned records and calculate orphan percentage (only the counts
+    # are needed, so no orphan rows are materialised or re-masked)
+    orphaned_appointments = total_appointments - valid_appointment_refs
+    orphaned_invoices = total_invoices - valid_invoice_refs
     
     total_child_records = total_appointments + total_invoices
     total_orphaned = orphaned_appointments + orphaned_invoices
@@ -81,10 +91,10 @@ def validate_referential_integrity(patients_df: pd.DataFrame, appointments_df: p
         validations['acceptable_orphan_level'] = True
     
     # Patient load distribution (detect data skew)
-    if len(appointments_df) > 0:
-        patient_appointment_counts = appointments_df['patient_uuid'].value_counts()
-        validations['max_appointments_per_patient'] = int(patient_appointment_counts.max())
-        validations['reasonable_appointment_distribution'] = bool(patient_appointment_counts.max() <= 100)
+    if len(appointments_per_patient) > 0:
+        max_appointments = int(appointments_per_patient.max())
+        validations['max_appointments_per_patient'] = max_appointments
+        validations['reasonable_appointment_distribution'] = bool(max_appointments <= 100)
     else:
         validations['max_appointments_per_patient'] = 0
         validations['reasonable_appointment_distribution'] = True
@@ -129,6 +139,9 @@ def validate_data_quality_metrics(source_df: pd.DataFrame, target_df: pd.DataFra
         }
     
     # Null value consistency analysis using proper mappings
+    # (null counts for every column come from one pass over each frame)
+    source_null_counts = source_df.isna().sum()
+    target_null_counts = target_df.isna().sum()
     null_analysis = {}
     for source_col in source_df.columns:
         target_col = column_mappings.get(source_col)
@@ -138,8 +151,8 @@ def validate_data_quality_metrics(source_df: pd.DataFrame, target_df: pd.DataFra
             continue
             
         if target_col in target_df.columns:
-            source_nulls = int(source_df[source_col].isna().sum())
-            target_nulls = int(target_df[target_col].isna().sum())
+            source_nulls = int(source_null_counts[source_col])
+            target_nulls = int(target_null_counts[target_col])
             null_difference = abs(source_nulls - target_nulls)
             
             # Use source column name for reporting but note the mapping
@@ -162,17 +175,19 @@ def validate_data_quality_metrics(source_df: pd.DataFrame, target_df: pd.DataFra
     # Value distribution checks (for numeric fields) - also use mappings
     numeric_analysis = {}
     try:
-        numeric_cols = source_df.select_dtypes(include=['number']).columns
-        for source_col in numeric_cols:
+        # Means of every numeric column, computed once per frame (NaN when all-null)
+        source_means = source_df.select_dtypes(include=['number']).mean()
+        target_means = target_df.select_dtypes(include=['number']).mean()
+        for source_col in source_means.index:
             target_col = column_mappings.get(source_col)
             
             # Skip legacy fields and unmapped columns
             if target_col is None:
                 continue
                 
-            if target_col in target_df.columns and not source_df[source_col].empty and not target_df[target_col].empty:
-                source_mean = float(source_df[source_col].mean()) if not source_df[source_col].isna().all() else 0
-                target_mean = float(target_df[target_col].mean()) if not target_df[target_col].isna().all() else 0
+            if target_col in target_df.columns and len(source_df) > 0 and len(target_df) > 0:
+                source_mean = 0 if pd.isna(source_means[source_col]) else float(source_means[source_col])
+                target_mean = 0 if pd.isna(target_means[target_col]) else float(target_means[target_col])
                 
                 # Set display name first for use in conditionals
                 display_name = f"{source_col} -> {target_col}" if source_col != target_col else source_col
@@ -221,12 +236,12 @@ def validate_data_quality_metrics(source_df: pd.DataFrame, target_df: pd.DataFra
 
 def calculate_combined_checksum_all(df1: pd.DataFrame, df2: pd.DataFrame, df3: pd.DataFrame) -> str:
     """Calculate combined SHA256 checksum for all three DataFrames"""
-    combined_string = (
-        df1.to_csv(index=False) + 
-        df2.to_csv(index=False) +
-        df3.to_csv(index=False)
-    ).encode('utf-8')
-    return hashlib.sha256(combined_string).hexdigest()
+    # Hash raw per-row hash bytes instead of formatting every value as CSV text
+    hasher = hashlib.sha256()
+    for df in (df1, df2, df3):
+        hasher.update(",".join(map(str, df.columns)).encode('utf-8'))
+        hasher.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return hasher.hexdigest()
 
 
 def generate_reconcile_report(
@@ -257,49 +272,62 @@ def generate_reconcile_report(
         invoices_source_rows == invoices_target_rows
     )
     
-    # Calculate checksums for all three tables (note: will differ due to transformations)
-    source_checksum = calculate_combined_checksum_all(
-        patients_source_df, appointments_source_df, invoices_source_df
-    )
-    target_checksum = calculate_combined_checksum_all(
-        patients_target_df, appointments_target_df, invoices_target_df
-    )
-    
-    # Run referential integrity validations
-    referential_integrity = validate_referential_integrity(
-        patients_target_df, appointments_target_df, invoices_target_df
-    )
-    
-    # Run data quality validations for each table
-    patients_quality = validate_data_quality_metrics(
-        patients_source_df, patients_target_df, "patients"
-    )
+    # The checksums, referential integrity and per-table quality checks are
+    # independent, so run them concurrently. Threads rather than processes:
+    # pandas releases the GIL in its C reductions, and no DataFrames need to
+    # be pickled across process boundaries.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Calculate checksums for all three tables (note: will differ due to transformations)
+        source_checksum_future = executor.submit(
+            calculate_combined_checksum_all,
+            patients_source_df, appointments_source_df, invoices_source_df
+        )
+        target_checksum_future = executor.submit(
+            calculate_combined_checksum_all,
+            patients_target_df, appointments_target_df, invoices_target_df
+        )
+        
+        # Run data quality validations for each table
+        patients_quality_future = executor.submit(
+            validate_data_quality_metrics, patients_source_df, patients_target_df, "patients"
+        )
+        appointments_quality_future = executor.submit(
+            validate_data_quality_metrics, appointments_source_df, appointments_target_df, "appointments"
+        )
+        invoices_quality_future = executor.submit(
+            validate_data_quality_metrics, invoices_source_df, invoices_target_df, "invoices"
+        )
+        
+        # Run referential integrity validations
+        referential_integrity = validate_referential_integrity(
+            patients_target_df, appointments_target_df, invoices_target_df
+        )
+        
+        source_checksum = source_checksum_future.result()
+        target_checksum = target_checksum_future.result()
+        patients_quality = patients_quality_future.result()
+        appointments_quality = appointments_quality_future.result()
+        invoices_quality = invoices_quality_future.result()
     
-    appointments_quality = validate_data_quality_metrics(
-        appointments_source_df, appointments_target_df, "appointments"
+    # Calculate overall validation status
+    # Short-circuit on the first failing check; the orphan and reference
+    # checks are the ones that fail on partial migrations, so they go first
+    all_referential_checks_passed = bool(
+        referential_integrity['acceptable_orphan_level']
+        and referential_integrity['appointments_reference_patients']
+        and referential_integrity['invoices_reference_patients']
+        and referential_integrity['reasonable_appointment_distribution']
     )
     
-    invoices_quality = validate_data_quality_metrics(
-        invoices_source_df, invoices_target_df, "invoices"
+    all_quality_checks_passed = bool(
+        invoices_quality['numeric_consistency_passed']  # dollars -> cents conversion
+        and patients_quality['null_consistency_passed']
+        and patients_quality['numeric_consistency_passed']
+        and appointments_quality['null_consistency_passed']
+        and appointments_quality['numeric_consistency_passed']
+        and invoices_quality['null_consistency_passed']
     )
     
-    # Calculate overall validation status
-    all_referential_checks_passed = all([
-        referential_integrity['appointments_reference_patients'],
-        referential_integrity['invoices_reference_patients'],
-        referential_integrity['acceptable_orphan_level'],
-        referential_integrity['reasonable_appointment_distribution']
-    ])
-    
-    all_quality_checks_passed = all([
-        patients_quality['null_consistency_passed'],
-        patients_quality['numeric_consistency_passed'],
-        appointments_quality['null_consistency_passed'],
-        appointments_quality['numeric_consistency_passed'],
-        invoices_quality['null_consistency_passed'],
-        invoices_quality['numeric_consistency_passed']
-    ])
-    
     # Create comprehensive report dictionary
     report = {
         # Basic row count information
@@ -342,11 +370,12 @@ def generate_reconcile_report(
     logger.info(f"Comprehensive reconciliation report generated: {output_file}")
     return report
 
-def print_reconciliation_summary(report_file: str = "reconcile_report.json"):
-    """Print a comprehensive formatted reconciliation summary from JSON report"""
+def print_reconciliation_summary(report_file: str = "reconcile_report.json", report: Optional[Dict[str, Any]] = None):
+    """Print a comprehensive formatted reconciliation summary from JSON report (or an already-loaded report dict)"""
     try:
-        with open(report_file, 'r') as f:
-            report = json.load(f)
+        if report is None:
+            with open(report_file, 'r') as f:
+                report = json.load(f)
         
         print(f"\n{'='*80}")
         print(f"COMPREHENSIVE MIGRATION RECONCILIATION REPORT")
@@ -427,53 +456,169 @@ def print_reconciliation_summary(report_file: str = "reconcile_report.json"):
 
 # ======================= MIGRATION FUNCTIONS =======================
 
-def validate_data(df: pd.DataFrame, model_class, table_name: str) -> tuple[List[dict], List[dict]]:
-    """Validate dataframe using Pydantic model, return successful and failed records"""
-    successful_records = []
+# Upsert statements for the export database (prepared once per executemany)
+PATIENT_UPSERT_SQL = """
+    INSERT INTO patients 
+    (patient_uuid, first_name, last_name, dob, phone_e164, email, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(patient_uuid) DO UPDATE SET
+        first_name = excluded.first_name,
+        last_name = excluded.last_name,
+        phone_e164 = excluded.phone_e164,
+        email = excluded.email
+"""
+
+ENCOUNTER_UPSERT_SQL = """
+    INSERT INTO encounters 
+    (encounter_uuid, patient_uuid, encounter_ts_utc, provider_name, location, status)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(encounter_uuid) DO UPDATE SET
+        encounter_ts_utc = excluded.encounter_ts_utc,
+        provider_name = excluded.provider_name,
+        location = excluded.location,
+        status = excluded.status
+"""
+
+INVOICE_UPSERT_SQL = """
+    INSERT INTO billing_invoices 
+    (invoice_uuid, patient_uuid, invoice_total_cents, status, issued_date_utc, paid_date_utc)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(invoice_uuid) DO UPDATE SET
+        invoice_total_cents = excluded.invoice_total_cents,
+        status = excluded.status,
+        paid_date_utc = excluded.paid_date_utc
+"""
+
+# Columns matching the VALUES order of each upsert statement
+PATIENT_COLUMNS = ['patient_uuid', 'first_name', 'last_name', 'dob', 'phone_e164', 'email', 'created_at']
+ENCOUNTER_COLUMNS = ['encounter_uuid', 'patient_uuid', 'encounter_ts_utc', 'provider_name', 'location', 'status']
+INVOICE_COLUMNS = ['invoice_uuid', 'patient_uuid', 'invoice_total_cents', 'status', 'issued_date_utc', 'paid_date_utc']
+
+# Column dtypes for the target frames used in reconciliation (patient_uuid is
+# left out: share_patient_uuid_categories gives every table one shared dtype).
+# Timestamps use microsecond resolution: nanoseconds only reach 1677-2262, and
+# any date the models accept must survive the cast. Patient dates stay as
+# validated, since reconciliation only counts their nulls.
+TARGET_DTYPES = {
+    "patients": {},
+    "encounters": {"encounter_ts_utc": "datetime64[us, UTC]", "status": "category"},
+    "billing_invoices": {
+        "invoice_total_cents": "int64",
+        "status": "category",
+        "issued_date_utc": "datetime64[us, UTC]",
+        "paid_date_utc": "datetime64[us, UTC]",
+    },
+}
+
+# Text columns of each source file, read as str without type inference.
+# Ids and amounts are left to inference so a malformed value fails its row
+# during validation instead of the whole load; dates stay raw text because
+# the validators apply the strict legacy format and timezone rules.
+SOURCE_DTYPES = {
+    "data/patients_data.csv": {
+        'first_name': 'str', 'last_name': 'str', 'dob': 'str',
+        'phone': 'str', 'email': 'str', 'created_at': 'str',
+    },
+    "data/appointments_data.csv": {
+        'appointment_date': 'str', 'provider_name': 'str', 'location': 'str', 'status': 'str',
+    },
+    "data/invoices_data.csv": {
+        'status': 'str', 'issued_date': 'str', 'paid_date': 'str',
+    },
+}
+
+# Rows per executemany call during the bulk load (all batches share one transaction)
+SQLITE_BATCH_SIZE = 10_000
+
+# Columns of the failed-record exports, in file order
+FAILED_RECORD_COLUMNS = ["row_index", "table", "legacy_id", "field", "error_message", "source_data"]
+
+# Rows formatted per to_csv chunk when writing target files
+CSV_CHUNK_SIZE = 100_000
+
+# Secondary indexes on the export database as (name, table, sql). They are
+# dropped and rebuilt around bulk loads that are large relative to the table.
+SQLITE_INDEXES = [
+    ("idx_encounters_patient_uuid", "encounters", "CREATE INDEX IF NOT EXISTS idx_encounters_patient_uuid ON encounters(patient_uuid)"),
+    ("idx_encounters_date", "encounters", "CREATE INDEX IF NOT EXISTS idx_encounters_date ON encounters(encounter_ts_utc)"),
+    ("idx_billing_invoices_patient_uuid", "billing_invoices", "CREATE INDEX IF NOT EXISTS idx_billing_invoices_patient_uuid ON billing_invoices(patient_uuid)"),
+    ("idx_billing_invoices_status", "billing_invoices", "CREATE INDEX IF NOT EXISTS idx_billing_invoices_status ON billing_invoices(status)"),
+    ("idx_patients_email", "patients", "CREATE INDEX IF NOT EXISTS idx_patients_email ON patients(email)"),
+]
+
+
+def validate_data(df: pd.DataFrame, model_class, table_name: str) -> tuple[pd.DataFrame, List[dict]]:
+    """Validate dataframe using Pydantic model, return successful rows (as a DataFrame) and failed records"""
     failed_records = []
+    columns = list(model_class.model_fields)  # model_dump() key order
     
     logger.info(f"Validating {len(df)} {table_name} records...")
-    
-    for index, row in df.iterrows():
+
+    # Check and transform whole columns at once with the model's vectorized
+    # validator; only the rows it rejects are validated one by one below
+    frame_validator = FRAME_VALIDATORS.get(model_class)
+    if frame_validator is not None:
+        valid_rows, valid_mask = frame_validator(df)
+        valid_mask = valid_mask.to_numpy()
+        valid_positions = valid_mask.nonzero()[0]
+        remaining_positions = (~valid_mask).nonzero()[0]
+    else:
+        valid_rows = pd.DataFrame(columns=columns)
+        valid_positions = np.array([], dtype=np.intp)
+        remaining_positions = np.arange(len(df))
+
+    # The Pydantic model has the final say on the remaining rows: it either
+    # accepts them (recovered) or reports exactly why they failed
+    remaining_df = df.iloc[remaining_positions]
+    records = remaining_df.to_dict(orient="records")
+    validate = model_class.model_validate
+    recovered_records = []
+
+    for position, index, row_dict in zip(remaining_positions, remaining_df.index, records):
         try:
-            row_dict = row.to_dict()
-        
-            validated_record = model_class(**row_dict)
-            successful_records.append(validated_record.model_dump())
+            validated_record = validate(row_dict)
+        except ValidationError as e:
+            # Structured field errors straight from pydantic-core
+            errors = e.errors()
+            field_names = list(dict.fromkeys(".".join(str(part) for part in err['loc']) for err in errors))
+            field_name = ", ".join(name for name in field_names if name) or "unknown"
+            error_message = "; ".join(
+                f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in errors
+            )
         except Exception as e:
-            logger.warning(f"Validation failed for {table_name} row {index}: {e}")
-            
-            # Extract field name(s) from Pydantic validation error
-            error_str = str(e)
-            field_names = []
-            
-            # Parse field name from Pydantic error format
-            if "validation error" in error_str.lower():
-                # Look for field name patterns in Pydantic errors
-                lines = error_str.split('\n')
-                for line in lines:
-                    line = line.strip()
-                    # Field names appear as standalone lines in Pydantic errors
-                    if line and not line.startswith('Value error') and not line.startswith('For further') and not 'validation error' in line.lower():
-                        # Skip numeric lines (like "1 validation error")
-                        if not line[0].isdigit():
-                            field_names.append(line)
-            
-            # Join multiple field names with comma, or use "unknown" if none found
-            field_name = ", ".join(field_names) if field_names else "unknown"
-            
-            # Simple error record - capture essential information including field
-            failed_records.append({
-                "row_index": index,
-                "table": table_name,
-                "legacy_id": row.to_dict().get('legacy_id', 'N/A'),
-                "field": field_name,
-                "error_message": str(e).replace('\n', ' | '),  # Single line for Excel
-                "source_data": str(row.to_dict())
-            })
+            # Anything else raised while building the model isn't tied to a field
+            field_name = "unknown"
+            error_message = str(e).replace('\n', ' | ')  # Single line for Excel
+        else:
+            recovered_records.append((position, validated_record.model_dump()))
+            continue
+
+        logger.warning(f"Validation failed for {table_name} row {index}: {error_message}")
+
+        # Simple error record - capture essential information including field
+        failed_records.append({
+            "row_index": index,
+            "table": table_name,
+            "legacy_id": row_dict.get('legacy_id', 'N/A'),
+            "field": field_name,
+            "error_message": error_message,
+            "source_data": str(row_dict)
+        })
+
+    # Keep successful rows in source order. Recovered rows stay object dtype
+    # so their datetime/None values aren't coerced to Timestamp/NaT.
+    successful_df = valid_rows
+    if recovered_records:
+        recovered_positions = [position for position, _ in recovered_records]
+        recovered_df = pd.DataFrame(
+            [record for _, record in recovered_records], columns=columns, dtype=object
+        )
+        order = np.argsort(np.concatenate([valid_positions, recovered_positions]), kind="stable")
+        successful_df = pd.concat([valid_rows, recovered_df], ignore_index=True).iloc[order]
+    successful_df = successful_df.reset_index(drop=True)
     
-    logger.info(f"{len(successful_records)} successful, {len(failed_records)} failed")
-    return successful_records, failed_records
+    logger.info(f"{len(successful_df)} successful, {len(failed_records)} failed")
+    return successful_df, failed_records
 
 
 def load_source_data() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
@@ -481,15 +626,53 @@ def load_source_data() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     logger.info("Loading source data...")
     
     # Replace with your actual file paths
-    patients_df = pd.read_csv("data/patients_data.csv")
-    appointments_df = pd.read_csv("data/appointments_data.csv") 
-    invoices_df = pd.read_csv("data/invoices_data.csv")
+    source_files = list(SOURCE_DTYPES)
+    
+    # The files are independent and pandas' C parser releases the GIL while
+    # tokenizing, so read all three concurrently
+    with ThreadPoolExecutor(max_workers=len(source_files)) as executor:
+        patients_df, appointments_df, invoices_df = executor.map(
+            lambda path: pd.read_csv(path, dtype=SOURCE_DTYPES[path]), source_files
+        )
     
     logger.info(f"Loaded: {len(patients_df)} patients, {len(appointments_df)} appointments, {len(invoices_df)} invoices")
     return patients_df, appointments_df, invoices_df
 
 
-def export_to_sqlite(patients: List[dict], appointments: List[dict], invoices: List[dict]):
+def apply_target_dtypes(df: pd.DataFrame, table: str) -> pd.DataFrame:
+    """Cast a target DataFrame to its TARGET_DTYPES (columns it doesn't have are skipped)"""
+    dtypes = {column: dtype for column, dtype in TARGET_DTYPES[table].items() if column in df.columns}
+    return df.astype(dtypes)
+
+
+def share_patient_uuid_categories(*dfs: pd.DataFrame):
+    """Convert patient_uuid to one categorical dtype shared by all given DataFrames (in place)"""
+    patient_uuids = union_categoricals(
+        [pd.Categorical(df['patient_uuid']) for df in dfs], sort_categories=True
+    )
+    patient_uuid_dtype = pd.CategoricalDtype(patient_uuids.categories)
+    for df in dfs:
+        df['patient_uuid'] = df['patient_uuid'].astype(patient_uuid_dtype)
+
+
+def frame_params(df: pd.DataFrame, columns: List[str]) -> List[tuple]:
+    """Upsert parameter tuples for the given columns of a DataFrame (Python scalars)"""
+    return list(df[columns].itertuples(index=False, name=None))
+
+
+def executemany_in_batches(cursor: sqlite3.Cursor, sql: str, params: List[tuple]):
+    """Run executemany over fixed-size slices of params to bound per-call memory"""
+    for start in range(0, len(params), SQLITE_BATCH_SIZE):
+        cursor.executemany(sql, params[start:start + SQLITE_BATCH_SIZE])
+
+
+def count_rows(cursor: sqlite3.Cursor, table: str) -> int:
+    """Return the number of rows currently in a table"""
+    cursor.execute(f"SELECT COUNT(*) FROM {table}")
+    return cursor.fetchone()[0]
+
+
+def export_to_sqlite(patients: pd.DataFrame, appointments: pd.DataFrame, invoices: pd.DataFrame):
     """Export migrated data to SQLite database"""
     # Create database export directory
     db_dir = "target_data/db_export"
@@ -498,10 +681,24 @@ def export_to_sqlite(patients: List[dict], appointments: List[dict], invoices: L
     db_path = f"{db_dir}/export.db"
     logger.info(f"Exporting data to SQLite database: {db_path}")
     
+    conn = None
     try:
-        # Create connection to SQLite database
-        conn = sqlite3.connect(db_path)
+        # Create connection to SQLite database. Autocommit mode (no implicit
+        # transactions from the sqlite3 module); the bulk load below manages
+        # its own explicit transaction
+        conn = sqlite3.connect(db_path, isolation_level=None)
         cursor = conn.cursor()
+
+        # Tune for bulk loading: WAL avoids rewriting the main file per commit,
+        # NORMAL sync only fsyncs at checkpoints, and a larger page cache keeps
+        # the B-trees in memory during the load
+        cursor.execute("PRAGMA page_size=65536")  # Only applies when the database file is first created
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-200000")  # ~200 MB page cache
+        cursor.execute("PRAGMA mmap_size=268435456")  # Serve reads from a memory map instead of pread calls
+        cursor.execute("PRAGMA wal_autocheckpoint=10000")  # Don't checkpoint mid-load
         
         # Create patients table
         cursor.execute("""
@@ -542,133 +739,71 @@ def export_to_sqlite(patients: List[dict], appointments: List[dict], invoices: L
             )
         """)
         
-        # Insert/Update patients data (UPSERT for data changes)
-        logger.info(f"Upserting {len(patients)} patients...")
-        patients_inserted = 0
-        patients_updated = 0
-        for patient in patients:
-            try:
-                # Get row count before operation
-                cursor.execute("SELECT changes()")
-                changes_before = cursor.fetchone()[0]
-                
-                cursor.execute("""
-                    INSERT INTO patients 
-                    (patient_uuid, first_name, last_name, dob, phone_e164, email, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(patient_uuid) DO UPDATE SET
-                        first_name = excluded.first_name,
-                        last_name = excluded.last_name,
-                        phone_e164 = excluded.phone_e164,
-                        email = excluded.email
-                """, (
-                    patient['patient_uuid'],
-                    patient['first_name'], 
-                    patient['last_name'],
-                    patient['dob'],
-                    patient.get('phone_e164'),
-                    patient['email'],
-                    patient['created_at']
-                ))
-                
-                # Check if it was an INSERT (new lastrowid) or UPDATE (existing record)
-                if cursor.lastrowid is not None and cursor.lastrowid > 0:
-                    patients_inserted += 1
-                else:
-                    patients_updated += 1
-            except sqlite3.Error as e:
-                logger.error(f"Error upserting patient {patient['patient_uuid']}: {e}")
-                raise
-        
-        logger.info(f"Patients: {patients_inserted} inserted, {patients_updated} updated")
-        
-        # Insert/Update appointments data (UPSERT for status/scheduling changes)
-        logger.info(f"Upserting {len(appointments)} appointments...")
-        appointments_inserted = 0
-        appointments_updated = 0
-        for appointment in appointments:
-            try:
-                cursor.execute("""
-                    INSERT INTO encounters 
-                    (encounter_uuid, patient_uuid, encounter_ts_utc, provider_name, location, status)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(encounter_uuid) DO UPDATE SET
-                        encounter_ts_utc = excluded.encounter_ts_utc,
-                        provider_name = excluded.provider_name,
-                        location = excluded.location,
-                        status = excluded.status
-                """, (
-                    appointment['encounter_uuid'],
-                    appointment['patient_uuid'],
-                    appointment['encounter_ts_utc'],
-                    appointment['provider_name'],
-                    appointment['location'],
-                    appointment['status']
-                ))
-                if cursor.lastrowid is not None and cursor.lastrowid > 0:
-                    appointments_inserted += 1
-                else:
-                    appointments_updated += 1
-            except sqlite3.Error as e:
-                logger.error(f"Error upserting appointment {appointment['encounter_uuid']}: {e}")
-                raise
-        
-        logger.info(f"Appointments: {appointments_inserted} inserted, {appointments_updated} updated")
-        
-        # Insert/Update invoices data (UPSERT for payment status/amount changes)
-        logger.info(f"Upserting {len(invoices)} invoices...")
-        invoices_inserted = 0
-        invoices_updated = 0
-        for invoice in invoices:
-            try:
-                cursor.execute("""
-                    INSERT INTO billing_invoices 
-                    (invoice_uuid, patient_uuid, invoice_total_cents, status, issued_date_utc, paid_date_utc)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(invoice_uuid) DO UPDATE SET
-                        invoice_total_cents = excluded.invoice_total_cents,
-                        status = excluded.status,
-                        paid_date_utc = excluded.paid_date_utc
-                """, (
-                    invoice['invoice_uuid'],
-                    invoice['patient_uuid'],
-                    invoice['invoice_total_cents'],
-                    invoice['status'],
-                    invoice['issued_date_utc'],
-                    invoice.get('paid_date_utc')
-                ))
-                if cursor.lastrowid is not None and cursor.lastrowid > 0:
-                    invoices_inserted += 1
-                else:
-                    invoices_updated += 1
-            except sqlite3.Error as e:
-                logger.error(f"Error upserting invoice {invoice['invoice_uuid']}: {e}")
-                raise
-        
-        logger.info(f"Invoices: {invoices_inserted} inserted, {invoices_updated} updated")
-        
-        # Commit the transaction
-        conn.commit()
-        
-        # Create indexes for better query performance
-        logger.info("Creating database indexes...")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_encounters_patient_uuid ON encounters(patient_uuid)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_encounters_date ON encounters(encounter_ts_utc)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_billing_invoices_patient_uuid ON billing_invoices(patient_uuid)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_billing_invoices_status ON billing_invoices(status)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_patients_email ON patients(email)")
-        
-        conn.commit()
+        # Bulk-load all three tables in a single transaction. A table's indexes
+        # are dropped first and rebuilt once afterwards when the batch is at
+        # least as large as the table, so the inserts don't pay per-row B-tree
+        # maintenance for every secondary index. Small incremental batches
+        # into a big table keep their indexes: rebuilding would rescan it all.
+        # BEGIN IMMEDIATE takes the write lock up front, so the index drops,
+        # upserts and rebuilds commit (and sync the WAL) exactly once.
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            existing_rows = {table: count_rows(cursor, table) for table in ("patients", "encounters", "billing_invoices")}
+            batch_rows = {"patients": len(patients), "encounters": len(appointments), "billing_invoices": len(invoices)}
+            for index_name, table, _ in SQLITE_INDEXES:
+                if batch_rows[table] >= existing_rows[table]:
+                    cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+            # Insert/Update patients data (UPSERT for data changes)
+            logger.info(f"Upserting {len(patients)} patients...")
+            patient_params = frame_params(patients, PATIENT_COLUMNS)
+            rows_before = existing_rows["patients"]
+            changes_before = conn.total_changes
+            executemany_in_batches(cursor, PATIENT_UPSERT_SQL, patient_params)
+            # Every upserted row is one change; new rows are the row-count growth
+            patients_inserted = count_rows(cursor, "patients") - rows_before
+            patients_updated = (conn.total_changes - changes_before) - patients_inserted
+            logger.info(f"Patients: {patients_inserted} inserted, {patients_updated} updated")
+
+            # Insert/Update appointments data (UPSERT for status/scheduling changes)
+            logger.info(f"Upserting {len(appointments)} appointments...")
+            appointment_params = frame_params(appointments, ENCOUNTER_COLUMNS)
+            rows_before = existing_rows["encounters"]
+            changes_before = conn.total_changes
+            executemany_in_batches(cursor, ENCOUNTER_UPSERT_SQL, appointment_params)
+            # Every upserted row is one change; new rows are the row-count growth
+            appointments_inserted = count_rows(cursor, "encounters") - rows_before
+            appointments_updated = (conn.total_changes - changes_before) - appointments_inserted
+            logger.info(f"Appointments: {appointments_inserted} inserted, {appointments_updated} updated")
+
+            # Insert/Update invoices data (UPSERT for payment status/amount changes)
+            logger.info(f"Upserting {len(invoices)} invoices...")
+            invoice_params = frame_params(invoices, INVOICE_COLUMNS)
+            rows_before = existing_rows["billing_invoices"]
+            changes_before = conn.total_changes
+            executemany_in_batches(cursor, INVOICE_UPSERT_SQL, invoice_params)
+            # Every upserted row is one change; new rows are the row-count growth
+            invoices_inserted = count_rows(cursor, "billing_invoices") - rows_before
+            invoices_updated = (conn.total_changes - changes_before) - invoices_inserted
+            logger.info(f"Invoices: {invoices_inserted} inserted, {invoices_updated} updated")
+
+            # Recreate dropped indexes for better query performance (kept ones are no-ops)
+            logger.info("Creating database indexes...")
+            for _, _, index_sql in SQLITE_INDEXES:
+                cursor.execute(index_sql)
+
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+        # Fold the WAL back into the main file once the load is done
+        cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
         
         # Print database statistics
-        cursor.execute("SELECT COUNT(*) FROM patients")
-        patient_count = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM encounters")
-        encounter_count = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM billing_invoices")
-        invoice_count = cursor.fetchone()[0]
+        patient_count = count_rows(cursor, "patients")
+        encounter_count = count_rows(cursor, "encounters")
+        invoice_count = count_rows(cursor, "billing_invoices")
         
         total_inserted = patients_inserted + appointments_inserted + invoices_inserted
         total_updated = patients_updated + appointments_updated + invoices_updated
@@ -689,8 +824,10 @@ def export_to_sqlite(patients: List[dict], appointments: List[dict], invoices: L
             conn.close()
 
 
-def save_target_data(successful_patients: List[dict], successful_appointments: List[dict], successful_invoices: List[dict]):
-    """Save validated data to target system (CSV files and SQLite database)"""
+def save_target_data(
+    successful_patients: pd.DataFrame, successful_appointments: pd.DataFrame, successful_invoices: pd.DataFrame
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Save validated data to target system (CSV files and SQLite database), return the target DataFrames"""
     logger.info("Saving validated data to target...")
     
     # Create target CSV directory
@@ -698,19 +835,43 @@ def save_target_data(successful_patients: List[dict], successful_appointments: L
     os.makedirs(target_dir, exist_ok=True)
     
     # Remove legacy fields for CSV output (keep only target schema fields)
-    clean_patients = [{k: v for k, v in patient.items() if k != 'legacy_id'} for patient in successful_patients]
-    clean_appointments = [{k: v for k, v in appointment.items() if k not in ['legacy_id', 'patient_legacy_id']} for appointment in successful_appointments]
-    clean_invoices = [{k: v for k, v in invoice.items() if k not in ['legacy_id', 'patient_legacy_id']} for invoice in successful_invoices]
-    
-    # Convert to DataFrames and save CSV files
-    pd.DataFrame(clean_patients).to_csv(f"{target_dir}/patients.csv", index=False)
-    pd.DataFrame(clean_appointments).to_csv(f"{target_dir}/encounters.csv", index=False)
-    pd.DataFrame(clean_invoices).to_csv(f"{target_dir}/billing_invoices.csv", index=False)
+    patients_df = successful_patients.drop(columns=['legacy_id'], errors='ignore')
+    appointments_df = successful_appointments.drop(columns=['legacy_id', 'patient_legacy_id'], errors='ignore')
+    invoices_df = successful_invoices.drop(columns=['legacy_id', 'patient_legacy_id'], errors='ignore')
     
-    # Save to SQLite database (with UPSERT handling duplicates automatically)
-    export_to_sqlite(clean_patients, clean_appointments, clean_invoices)
+    # The four outputs are independent, so write them concurrently: sqlite3
+    # releases the GIL while executing statements and syncing, and file
+    # writes release it too, so the CSV formatting overlaps the database I/O
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Save CSV files, formatted and written in bounded chunks
+        csv_futures = [
+            executor.submit(df.to_csv, f"{target_dir}/{file_name}", index=False, chunksize=CSV_CHUNK_SIZE)
+            for df, file_name in (
+                (patients_df, "patients.csv"),
+                (appointments_df, "encounters.csv"),
+                (invoices_df, "billing_invoices.csv"),
+            )
+        ]
+        
+        # Save to SQLite database (with UPSERT handling duplicates automatically)
+        sqlite_future = executor.submit(export_to_sqlite, patients_df, appointments_df, invoices_df)
+        
+        # Surface any write error
+        for future in csv_futures + [sqlite_future]:
+            future.result()
     
     logger.info("Data saved to target system (CSV and SQLite)")
+    return patients_df, appointments_df, invoices_df
+
+
+def failed_records_frame(failed_records: List[dict]) -> pd.DataFrame:
+    """Build the failed-records DataFrame column by column with a fixed schema"""
+    # Known columns and object dtype up front: no per-dict key discovery or
+    # dtype inference over the (mostly free-text) error columns
+    return pd.DataFrame({
+        column: pd.Series([record[column] for record in failed_records], dtype=object)
+        for column in FAILED_RECORD_COLUMNS
+    })
 
 
 def export_failed_records(failed_patients: List[dict], failed_appointments: List[dict], failed_invoices: List[dict]) -> Dict[str, str]:
@@ -726,7 +887,7 @@ def export_failed_records(failed_patients: List[dict], failed_appointments: List
     # Export failed patients
     if failed_patients:
         patients_error_file = f"{failed_dir}/failed_patients_{timestamp}.csv"
-        failed_patients_df = pd.DataFrame(failed_patients)
+        failed_patients_df = failed_records_frame(failed_patients)
         failed_patients_df.to_csv(patients_error_file, index=False)
         exported_files['patients'] = patients_error_file
         logger.info(f"Exported {len(failed_patients)} failed patient records to {patients_error_file}")
@@ -734,7 +895,7 @@ def export_failed_records(failed_patients: List[dict], failed_appointments: List
     # Export failed encounters
     if failed_appointments:
         encounters_error_file = f"{failed_dir}/failed_encounters_{timestamp}.csv"
-        failed_appointments_df = pd.DataFrame(failed_appointments)
+        failed_appointments_df = failed_records_frame(failed_appointments)
         failed_appointments_df.to_csv(encounters_error_file, index=False)
         exported_files['encounters'] = encounters_error_file
         logger.info(f"Exported {len(failed_appointments)} failed encounter records to {encounters_error_file}")
@@ -742,7 +903,7 @@ def export_failed_records(failed_patients: List[dict], failed_appointments: List
     # Export failed billing_invoices
     if failed_invoices:
         billing_invoices_error_file = f"{failed_dir}/failed_billing_invoices_{timestamp}.csv"
-        failed_invoices_df = pd.DataFrame(failed_invoices)
+        failed_invoices_df = failed_records_frame(failed_invoices)
         failed_invoices_df.to_csv(billing_invoices_error_file, index=False)
         exported_files['billing_invoices'] = billing_invoices_error_file
         logger.info(f"Exported {len(failed_invoices)} failed billing_invoice records to {billing_invoices_error_file}")
@@ -760,16 +921,14 @@ def main():
     logger.info("Starting Healthcare Data Migration...")
     logger.info(f"Migration started at: {migration_start_timestamp.isoformat()}")
     
-    # Clean up old failed records from previous runs
+    # Clean up old failed records from previous runs (the directory only ever
+    # holds this tool's exports, so empty it in one go; a failed removal
+    # raises rather than leaving stale files to be reported as this run's)
     failed_dir = "target_data/failed"
     if os.path.exists(failed_dir):
-        old_files = [f for f in os.listdir(failed_dir) if f.endswith('.csv')]
-        if old_files:
-            logger.info(f"Cleaning up {len(old_files)} old failed record files...")
-            for file in old_files:
-                os.remove(os.path.join(failed_dir, file))
-        else:
-            logger.info("No old failed record files to clean up")
+        logger.info("Cleaning up old failed record files...")
+        shutil.rmtree(failed_dir)
+    os.makedirs(failed_dir, exist_ok=True)
     
     # Initialize timing dictionary
     timing = {}
@@ -783,31 +942,38 @@ def main():
         # 2. Validate and transform data
         validation_start = time.time()
         
-        # Validate all data (UUIDs are now generated deterministically in models)
-        successful_patients, failed_patients = validate_data(patients_source_df, PatientModel, "patients")
-        successful_appointments, failed_appointments = validate_data(appointments_source_df, EncounterModel, "appointments")
-        successful_invoices, failed_invoices = validate_data(invoices_source_df, InvoiceModel, "invoices")
+        # Validate all data (UUIDs are now generated deterministically in models).
+        # The three entity streams are independent, so validate them concurrently;
+        # the vectorized pandas/NumPy passes release the GIL for much of their work
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            patients_future = executor.submit(validate_data, patients_source_df, PatientModel, "patients")
+            appointments_future = executor.submit(validate_data, appointments_source_df, EncounterModel, "appointments")
+            invoices_future = executor.submit(validate_data, invoices_source_df, InvoiceModel, "invoices")
+            successful_patients, failed_patients = patients_future.result()
+            successful_appointments, failed_appointments = appointments_future.result()
+            successful_invoices, failed_invoices = invoices_future.result()
         timing['data_validation_seconds'] = round(time.time() - validation_start, 2)
         
         # 3. Save validated data to target
         save_start = time.time()
-        save_target_data(successful_patients, successful_appointments, successful_invoices)
+        patients_target_df, appointments_target_df, invoices_target_df = save_target_data(
+            successful_patients, successful_appointments, successful_invoices
+        )
         timing['data_saving_seconds'] = round(time.time() - save_start, 2)
         
-        # 4. Load target data for reconciliation (from saved files)
+        # 4. Prepare target data for reconciliation
         transform_start = time.time()
-        logger.info("Loading target data for reconciliation...")
+        logger.info("Preparing target data for reconciliation...")
         
-        # Load target data from saved CSV files instead of using in-memory data
-        patients_target_df = pd.read_csv("target_data/target/patients.csv")
-        appointments_target_df = pd.read_csv("target_data/target/encounters.csv") 
-        invoices_target_df = pd.read_csv("target_data/target/billing_invoices.csv")
+        # Reconcile against the frames that were just written rather than
+        # reading the CSVs back, typed in a single astype pass per table
+        patients_target_df = apply_target_dtypes(patients_target_df, "patients")
+        appointments_target_df = apply_target_dtypes(appointments_target_df, "encounters")
+        invoices_target_df = apply_target_dtypes(invoices_target_df, "billing_invoices")
         
-        # Convert datetime columns back to proper types for reconciliation
-        appointments_target_df['encounter_ts_utc'] = pd.to_datetime(appointments_target_df['encounter_ts_utc'])
-        invoices_target_df['issued_date_utc'] = pd.to_datetime(invoices_target_df['issued_date_utc'])
-        if 'paid_date_utc' in invoices_target_df.columns:
-            invoices_target_df['paid_date_utc'] = pd.to_datetime(invoices_target_df['paid_date_utc'])
+        # Encode the patient foreign key as a shared categorical so the
+        # reconciliation isin/groupby passes work on integer codes
+        share_patient_uuid_categories(patients_target_df, appointments_target_df, invoices_target_df)
         
         timing['data_transformation_seconds'] = round(time.time() - transform_start, 2)
         
@@ -822,8 +988,8 @@ def main():
             invoices_target_df=invoices_target_df
         )
         
-        # 6. Print summary
-        print_reconciliation_summary()
+        # 6. Print summary (from the in-memory report, no need to re-read the JSON)
+        print_reconciliation_summary(report=report)
         
         # 7. Log migration summary
         migration_end_time = time.time()
@@ -837,6 +1003,13 @@ def main():
         for phase, duration in timing.items():
             logger.info(f"  {phase.replace('_', ' ').title()}: {duration} seconds")
         
+        # Row counts of every output file, already known in memory, for the summary
+        record_counts = {
+            "target_data/target/patients.csv": len(patients_target_df),
+            "target_data/target/encounters.csv": len(appointments_target_df),
+            "target_data/target/billing_invoices.csv": len(invoices_target_df),
+        }
+        
         total_failed = len(failed_patients) + len(failed_appointments) + len(failed_invoices)
         if total_failed == 0:
             logger.info("Migration completed successfully with no failures")
@@ -848,6 +1021,12 @@ def main():
             
             # Export failed records to files
             exported_files = export_failed_records(failed_patients, failed_appointments, failed_invoices)
+            failed_counts = {
+                'patients': len(failed_patients),
+                'encounters': len(failed_appointments),
+                'billing_invoices': len(failed_invoices),
+            }
+            record_counts.update({file_path: failed_counts[table] for table, file_path in exported_files.items()})
             if exported_files:
                 logger.info("Failed records exported to:")
                 for table, file_path in exported_files.items():
@@ -856,7 +1035,7 @@ def main():
         logger.info("Check reconcile_report.json for detailed metrics and timing information")
         
         # Log migration summary
-        log_migration_summary()
+        log_migration_summary(record_counts)
         
     except Exception as e:
         migration_end_time = time.time()
@@ -865,8 +1044,20 @@ def main():
         raise
 
 
-def log_migration_summary():
-    """Log a summary of migration outputs and directory structure"""
+def count_csv_records(file_path: str) -> int:
+    """Count data rows in a CSV file by scanning for newlines (header excluded)"""
+    with open(file_path, 'rb') as f:
+        newlines = sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b''))
+    return max(newlines - 1, 0)
+
+
+def log_migration_summary(record_counts: Optional[Dict[str, int]] = None):
+    """Log a summary of migration outputs and directory structure
+
+    record_counts maps output file paths to their row counts; files missing
+    from it are counted on disk instead of being parsed.
+    """
+    record_counts = record_counts or {}
     logger.info("="*30)
     logger.info("MIGRATION OUTPUT SUMMARY")
     logger.info("="*30)
@@ -878,8 +1069,10 @@ def log_migration_summary():
         for file in ["patients.csv", "encounters.csv", "billing_invoices.csv"]:
             file_path = f"{target_dir}/{file}"
             if os.path.exists(file_path):
-                df = pd.read_csv(file_path)
-                logger.info(f"   {file}: {len(df):,} records")
+                record_count = record_counts.get(file_path)
+                if record_count is None:
+                    record_count = count_csv_records(file_path)
+                logger.info(f"   {file}: {record_count:,} records")
             else:
                 logger.info(f"   {file}: Not found")
     
@@ -903,8 +1096,10 @@ def log_migration_summary():
             logger.info("Failed Records (target_data/failed/):")
             for file in failed_files:
                 file_path = f"{failed_dir}/{file}"
-                df = pd.read_csv(file_path)
-                logger.info(f"   {file}: {len(df):,} failed records")
+                record_count = record_counts.get(file_path)
+                if record_count is None:
+                    record_count = count_csv_records(file_path)
+                logger.info(f"   {file}: {record_count:,} failed records")
         else:
             logger.info("Failed Records: None (all records processed successfully)")
     else:
@@ -2,38 +2,125 @@
 Pydantic models for data validation and transformation
 """
 
-from pydantic import BaseModel, validator, Field
+from pydantic import BaseModel, validator, model_validator, Field
 from datetime import datetime, date
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Mapping
+from types import MappingProxyType
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 import phonenumbers
 from phonenumbers import NumberParseException
 import logging
+import re
+import hashlib
+import numpy as np
 import pandas as pd
 import uuid
 
 
 logger = logging.getLogger(__name__)
 
+# Module-global alias: one global lookup instead of pd + attribute per call
+_isna = pd.isna
+
+# Basic email format (applied after strip + lower-case)
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+
+# Legacy status codes (upper-cased) -> target status values
+# (read-only views, so no caller can mutate the shared tables)
+ENCOUNTER_STATUS_MAP = MappingProxyType({'SCHEDULED': 'scheduled', 'CANCELLED': 'cancelled', 'COMPLETED': 'completed'})
+INVOICE_STATUS_MAP = MappingProxyType({'OPEN': 'open', 'PAID': 'paid'})
+
+# Legacy timestamps are New York wall-clock times; targets are UTC
+NEW_YORK = ZoneInfo('America/New_York')
+UTC = ZoneInfo('UTC')
+
+# Fixed legacy timestamp layout 'YYYY-MM-DD HH:MM' (ASCII digits only)
+_LOCAL_DATETIME_RE = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}', re.ASCII)
+
+# Cheap phone prefilter: a valid US number carries at least 10 digits (or vanity letters),
+# so anything shorter can be rejected without running the phonenumbers parser
+_PHONE_RE = re.compile(r'(?:[^\dA-Za-z]*[\dA-Za-z]){10}')
+
+@lru_cache(maxsize=None)
+def _namespace_uuid(namespace: str) -> uuid.UUID:
+    """uuid5 namespace for an entity kind (derived once per kind)"""
+    return uuid.uuid5(uuid.NAMESPACE_DNS, f"suno_migration_{namespace}")
+
 def generate_deterministic_uuid(namespace: str, value: int) -> str:
     """Generate deterministic UUID based on namespace and legacy_id to ensure consistency across runs"""
-    namespace_uuid = uuid.uuid5(uuid.NAMESPACE_DNS, f"suno_migration_{namespace}")
-    deterministic_uuid = uuid.uuid5(namespace_uuid, str(value))
+    deterministic_uuid = uuid.uuid5(_namespace_uuid(namespace), str(value))
     return deterministic_uuid.hex
 
+def generate_deterministic_uuids(namespace: str, values) -> List[str]:
+    """Batch generate_deterministic_uuid: one SHA-1 per value, with the RFC 4122 bits set in NumPy"""
+    if len(values) == 0:
+        return []
+    base = hashlib.sha1(_namespace_uuid(namespace).bytes)
+    digests = bytearray()
+    for value in values:
+        h = base.copy()
+        h.update(str(value).encode('utf-8'))
+        digests += h.digest()[:16]
+    raw = np.frombuffer(bytes(digests), dtype=np.uint8).reshape(-1, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x50  # version 5
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    text = raw.tobytes().hex()
+    return [text[i:i + 32] for i in range(0, len(text), 32)]
+
 def is_null_or_empty(v):
     """Check if value is None, NaN, or empty string"""
     if v is None:
         return True
-    if pd.isna(v):  # This should catch NaN from pandas
-        return True
-    if isinstance(v, str) and v.strip() == '':
-        return True
-    # Handle the case where NaN gets converted to string "nan"
-    if isinstance(v, str) and v.lower() == 'nan':
+    if isinstance(v, str):
+        # Strings are the common case and never NaN, so skip pd.isna for them.
+        # Also handle the case where NaN gets converted to string "nan"
+        return v.strip() == '' or v.lower() == 'nan'
+    if _isna(v):  # This should catch NaN from pandas
         return True
     return False
 
+def parse_local_datetime(v) -> datetime:
+    """Parse a legacy 'YYYY-MM-DD HH:MM' America/New_York timestamp and convert it to UTC"""
+    text = str(v)
+    if _LOCAL_DATETIME_RE.fullmatch(text):
+        # Fixed layout: five integer slices instead of the strptime state machine
+        # (out-of-range fields still raise ValueError from the constructor)
+        local = datetime(
+            int(text[0:4]), int(text[5:7]), int(text[8:10]), int(text[11:13]), int(text[14:16]),
+            tzinfo=NEW_YORK,
+        )
+    else:
+        local = datetime.strptime(text, '%Y-%m-%d %H:%M').replace(tzinfo=NEW_YORK)
+    return local.astimezone(UTC)
+
+@lru_cache(maxsize=200_000)
+def _parse_e164(raw: str, region: str = "US") -> Optional[str]:
+    """E.164 form (+1XXXXXXXXXX) of raw, or None if it isn't a valid number (cached per raw string)"""
+    if _PHONE_RE.match(raw) is None:
+        return None
+    try:
+        parsed = phonenumbers.parse(raw, region)
+        if phonenumbers.is_valid_number(parsed):
+            e164 = phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+            # Strictly enforce +1XXXXXXXXXX format (exactly 12 characters: +1 + 10 digits)
+            if len(e164) == 12 and e164.startswith('+1') and e164[2:].isdigit():
+                return e164
+    except NumberParseException:
+        pass
+    return None
+
+def normalize_phone_e164(v) -> Optional[str]:
+    """Convert a US phone number to E.164 (+1XXXXXXXXXX); blank becomes None, invalid raises ValueError"""
+    if is_null_or_empty(v):
+        return None  # "Blank ➜ NULL" 
+    e164 = _parse_e164(str(v))
+    if e164 is not None:
+        return e164
+    
+    # Invalid phone numbers should FAIL the record
+    raise ValueError(f"Invalid phone number format: '{v}'. Must convert to valid E.164 format (+1XXXXXXXXXX) or be blank.")
+
 class PatientModel(BaseModel):
     class Config:
         populate_by_name = True  # Allow both field names and aliases
@@ -49,11 +136,17 @@ class PatientModel(BaseModel):
     # Keep legacy_id for mapping purposes (will be excluded in final output)
     legacy_id: int = Field(alias='legacy_id')
     
-    def __init__(self, **data):
+    @model_validator(mode='before')
+    @classmethod
+    def assign_uuids(cls, data):
         # Generate deterministic UUID based on legacy_id before validation
+        # (runs for __init__, model_validate and TypeAdapter alike)
+        if not isinstance(data, dict):
+            return data
+        data = dict(data)
         if 'legacy_id' in data and not data.get('patient_uuid'):
             data['patient_uuid'] = generate_deterministic_uuid('patient', data['legacy_id'])
-        super().__init__(**data)
+        return data
 
     @validator('dob', pre=True)
     def parse_dob(cls, v):
@@ -69,8 +162,7 @@ class PatientModel(BaseModel):
         if is_null_or_empty(v):
             raise ValueError("created_at is required")
         try:
-            local = datetime.strptime(str(v), '%Y-%m-%d %H:%M').replace(tzinfo=ZoneInfo('America/New_York'))
-            return local.astimezone(ZoneInfo('UTC'))
+            return parse_local_datetime(v)
         except Exception:
             raise ValueError(f"Invalid datetime format: {v}")
 
@@ -82,30 +174,14 @@ class PatientModel(BaseModel):
         email = str(v).strip().lower()
         
         # Basic email format validation
-        import re
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        if not re.match(email_pattern, email):
+        if not re.match(EMAIL_PATTERN, email):
             raise ValueError(f"Invalid email format: '{v}'. Must be a valid email address.")
             
         return email
 
     @validator('phone_e164', pre=True)
     def to_e164(cls, v):
-        if is_null_or_empty(v):
-            return None  # "Blank ➜ NULL" 
-        try:
-            parsed = phonenumbers.parse(str(v), "US")
-            if phonenumbers.is_valid_number(parsed):
-                e164 = phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
-                # Strictly enforce +1XXXXXXXXXX format (exactly 12 characters: +1 + 10 digits)
-                if len(e164) == 12 and e164.startswith('+1') and e164[2:].isdigit():
-                    return e164
-        except NumberParseException:
-            pass
-        
-        # Invalid phone numbers should FAIL the record
-        raise ValueError(f"Invalid phone number format: '{v}'. Must convert to valid E.164 format (+1XXXXXXXXXX) or be blank.")
+        return normalize_phone_e164(v)
 
 
 class EncounterModel(BaseModel):
@@ -123,21 +199,25 @@ class EncounterModel(BaseModel):
     legacy_id: int = Field(alias='legacy_id')
     patient_legacy_id: int = Field(alias='patient_id')
     
-    def __init__(self, **data):
+    @model_validator(mode='before')
+    @classmethod
+    def assign_uuids(cls, data):
         # Generate deterministic UUIDs based on legacy IDs
+        if not isinstance(data, dict):
+            return data
+        data = dict(data)
         if 'legacy_id' in data and not data.get('encounter_uuid'):
             data['encounter_uuid'] = generate_deterministic_uuid('encounter', data['legacy_id'])
         if 'patient_id' in data and not data.get('patient_uuid'):
             data['patient_uuid'] = generate_deterministic_uuid('patient', data['patient_id'])
-        super().__init__(**data)
+        return data
 
     @validator('encounter_ts_utc', pre=True)
     def parse_apt(cls, v):
         if is_null_or_empty(v):
             raise ValueError("encounter_ts_utc is required")
         try:
-            local = datetime.strptime(str(v), '%Y-%m-%d %H:%M').replace(tzinfo=ZoneInfo('America/New_York'))
-            return local.astimezone(ZoneInfo('UTC'))
+            return parse_local_datetime(v)
         except Exception:
             raise ValueError(f"Invalid datetime format: {v}")
 
@@ -146,10 +226,10 @@ class EncounterModel(BaseModel):
         if is_null_or_empty(v):
             raise ValueError("Status is required")
         # Map: SCHEDULED→scheduled, CANCELLED→cancelled, COMPLETED→completed
-        mapping = {'SCHEDULED': 'scheduled', 'CANCELLED': 'cancelled', 'COMPLETED': 'completed'}
         status_upper = str(v).strip().upper()
-        if status_upper in mapping:
-            return mapping[status_upper]
+        status = ENCOUNTER_STATUS_MAP.get(status_upper)
+        if status is not None:
+            return status
         else:
             raise ValueError(f"Invalid status value: '{v}'. Must be one of: SCHEDULED, CANCELLED, COMPLETED")
 
@@ -169,13 +249,18 @@ class InvoiceModel(BaseModel):
     legacy_id: int = Field(alias='legacy_id')
     patient_legacy_id: int = Field(alias='patient_id')
     
-    def __init__(self, **data):
+    @model_validator(mode='before')
+    @classmethod
+    def assign_uuids(cls, data):
         # Generate deterministic UUIDs based on legacy IDs
+        if not isinstance(data, dict):
+            return data
+        data = dict(data)
         if 'legacy_id' in data and not data.get('invoice_uuid'):
             data['invoice_uuid'] = generate_deterministic_uuid('invoice', data['legacy_id'])
         if 'patient_id' in data and not data.get('patient_uuid'):
             data['patient_uuid'] = generate_deterministic_uuid('patient', data['patient_id'])
-        super().__init__(**data) 
+        return data 
 
     @validator('invoice_total_cents', pre=True)
     def convert_dollars_to_cents(cls, v):
@@ -195,8 +280,7 @@ class InvoiceModel(BaseModel):
         if is_null_or_empty(v):
             return None  # "blank paid date ➜ NULL"
         try:
-            local = datetime.strptime(str(v), '%Y-%m-%d %H:%M').replace(tzinfo=ZoneInfo('America/New_York'))
-            return local.astimezone(ZoneInfo('UTC'))
+            return parse_local_datetime(v)
         except Exception:
             raise ValueError(f"Invalid datetime format: {v}")
 
@@ -205,8 +289,7 @@ class InvoiceModel(BaseModel):
         if is_null_or_empty(v): 
             return None  # "blank paid date ➜ NULL"
         try:
-            local = datetime.strptime(str(v), '%Y-%m-%d %H:%M').replace(tzinfo=ZoneInfo('America/New_York'))
-            return local.astimezone(ZoneInfo('UTC'))
+            return parse_local_datetime(v)
         except Exception:
             raise ValueError(f"Invalid datetime format: {v}")
 
@@ -215,11 +298,242 @@ class InvoiceModel(BaseModel):
         if is_null_or_empty(v):
             raise ValueError("Status is required")
         # Map: OPEN→open, PAID→paid
-        mapping = {'OPEN': 'open', 'PAID': 'paid'}
         status_upper = str(v).strip().upper()
-        if status_upper in mapping:
-            return mapping[status_upper]
+        status = INVOICE_STATUS_MAP.get(status_upper)
+        if status is not None:
+            return status
         else:
-            raise ValueError(f"Invalid status value: '{v}'. Must be one of: OPEN, PAID") 
+            raise ValueError(f"Invalid status value: '{v}'. Must be one of: OPEN, PAID")
+
+
+# ======================= VECTORIZED FRAME VALIDATION =======================
+#
+# Column-at-a-time equivalents of the models above, so a migration doesn't
+# have to build one Pydantic model per source row. Each validate_*_frame
+# function returns the rows that passed every check (transformed, with the
+# model's field order and model_dump() value types) plus a boolean mask over
+# the input. Checks are deliberately at least as strict as the models: rows
+# outside the mask should be re-validated with the model itself, which stays
+# the source of truth and produces the detailed error messages.
+
+def _column(df: pd.DataFrame, name: str) -> pd.Series:
+    """Return df[name], or an all-null column if the frame doesn't have it"""
+    if name in df.columns:
+        return df[name]
+    return pd.Series(None, index=df.index, dtype=object)
+
+def _str_mask(col: pd.Series) -> pd.Series:
+    """Rows holding a str value"""
+    if isinstance(col.dtype, pd.StringDtype):
+        return col.notna()
+    return col.map(lambda v: isinstance(v, str)).astype(bool)
+
+def _null_or_empty_mask(col: pd.Series) -> pd.Series:
+    """Vectorized is_null_or_empty"""
+    is_str = _str_mask(col)
+    text = col[is_str].astype(str)
+    blank = (text.str.strip() == '') | (text.str.lower() == 'nan')
+    return col.isna() | blank.reindex(col.index, fill_value=False)
+
+def _integral_mask(col: pd.Series) -> pd.Series:
+    """Rows holding an integral number (anything else is left to the model)"""
+    if pd.api.types.is_bool_dtype(col.dtype):
+        return pd.Series(False, index=col.index)
+    if pd.api.types.is_integer_dtype(col.dtype):
+        return col.notna()
+    if pd.api.types.is_float_dtype(col.dtype):
+        return col.notna() & (col % 1 == 0)
+    return pd.Series(False, index=col.index)
+
+def _map_unique(col: pd.Series, func) -> pd.Series:
+    """Apply func once per distinct non-null value; values func rejects become None (object dtype)"""
+    lookup = {}
+    for value in col.dropna().unique():
+        try:
+            lookup[value] = func(value)
+        except Exception:
+            lookup[value] = None
+    return pd.Series([lookup.get(v) for v in col], index=col.index, dtype=object)
+
+def _status_column(col: pd.Series, mapping: Mapping[str, str]) -> pd.Series:
+    """Map legacy status codes through mapping (unknown or blank values become NaN)"""
+    text = col.where(~_null_or_empty_mask(col)).dropna().astype(str)
+    return text.str.strip().str.upper().map(mapping).reindex(col.index)
+
+def _uuid_column(namespace: str, ids: pd.Series) -> pd.Series:
+    """Deterministic UUIDs for the given legacy ids (same inputs as the models' assign_uuids)"""
+    # Hash each distinct id once; foreign keys repeat across child rows
+    codes, uniques = pd.factorize(ids)
+    uuids = np.asarray(generate_deterministic_uuids(namespace, uniques.tolist()), dtype=object)
+    return pd.Series(uuids[codes], index=ids.index, dtype=object)
+
+def _uuid_not_supplied(df: pd.DataFrame, name: str) -> pd.Series:
+    """Rows that don't carry a pre-assigned UUID (those are left to the model)"""
+    if name not in df.columns:
+        return pd.Series(True, index=df.index)
+    return df[name].isna()
+
+# Strict shapes of legacy dates/timestamps; anything else is left to the model's strptime
+_DATE_SHAPE = r'^\d{4}-\d{2}-\d{2}$'
+_LOCAL_DATETIME_SHAPE = r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}$'
+
+# Local times pandas can localize to the same instant as zoneinfo: before 1678
+# its tz tables fall off (wrong offset) and near year 10000 UTC it can't
+# localize at all, so timestamps outside this window are left to the model
+_LOCALIZE_MIN = pd.Timestamp('1678-01-01')
+_LOCALIZE_MAX = pd.Timestamp('9999-12-31')
+
+def _strict_to_datetime(col: pd.Series, shape: str, fmt: str) -> pd.Series:
+    """Parse the str values of col that match shape with fmt in one pass (NaT everywhere else)"""
+    matches = _str_mask(col) & col.astype(str).str.match(shape).eq(True)
+    return pd.to_datetime(col.where(matches), format=fmt, errors='coerce')
+
+def _object_column(parsed: pd.Series, values) -> pd.Series:
+    """values (one per row of parsed) as an object column, None where parsed is NaT"""
+    out = np.where(parsed.notna().to_numpy(), np.asarray(values, dtype=object), None)
+    return pd.Series(out, index=parsed.index, dtype=object)
+
+def _date_column(col: pd.Series) -> pd.Series:
+    """Vectorized date parsing of 'YYYY-MM-DD' values (datetime.date objects)"""
+    parsed = _strict_to_datetime(col, _DATE_SHAPE, '%Y-%m-%d')
+    return _object_column(parsed, parsed.dt.date)
+
+def _local_datetime_column(col: pd.Series) -> pd.Series:
+    """Vectorized parse_local_datetime (UTC datetime objects)"""
+    parsed = _strict_to_datetime(col, _LOCAL_DATETIME_SHAPE, '%Y-%m-%d %H:%M')
+    parsed = parsed.where((parsed >= _LOCALIZE_MIN) & (parsed < _LOCALIZE_MAX))
+    # Same wall-clock rules as zoneinfo with fold=0: ambiguous times take the
+    # first (daylight) offset, and times in the spring-forward gap keep the
+    # pre-transition offset, i.e. shift forward by the one-hour gap
+    utc = parsed.dt.tz_localize(
+        NEW_YORK,
+        ambiguous=np.ones(len(parsed), dtype=bool),
+        nonexistent=pd.Timedelta(hours=1),
+    ).dt.tz_convert(UTC)
+    return _object_column(utc, utc.dt.to_pydatetime())
+
+def validate_patients_frame(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.Series]:
+    """Vectorized PatientModel over a legacy patients frame"""
+    legacy_id = _column(df, 'legacy_id')
+    first_name = _column(df, 'first_name')
+    last_name = _column(df, 'last_name')
+    dob = _column(df, 'dob')
+    phone = _column(df, 'phone')
+    email = _column(df, 'email')
+    created_at = _column(df, 'created_at')
+
+    dob_values = _date_column(dob)
+    created_values = _local_datetime_column(created_at)
+
+    phone_blank = _null_or_empty_mask(phone)
+    phone_values = _map_unique(phone.where(~phone_blank), lambda v: _parse_e164(str(v)))
+
+    email_values = email.astype(str).str.strip().str.lower()
+    email_ok = ~_null_or_empty_mask(email) & email_values.str.match(EMAIL_PATTERN).eq(True)
+
+    valid = (
+        _integral_mask(legacy_id)
+        & _uuid_not_supplied(df, 'patient_uuid')
+        & _str_mask(first_name)
+        & _str_mask(last_name)
+        & dob_values.notna()
+        & (phone_blank | phone_values.notna())
+        & email_ok
+        & created_values.notna()
+    )
+
+    rows = pd.DataFrame({
+        'patient_uuid': _uuid_column('patient', legacy_id[valid]),
+        'first_name': first_name[valid],
+        'last_name': last_name[valid],
+        'dob': dob_values[valid],
+        'phone_e164': phone_values[valid],
+        'email': email_values[valid],
+        'created_at': created_values[valid],
+        'legacy_id': legacy_id[valid].astype('int64'),
+    })
+    return rows, valid
+
+def validate_encounters_frame(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.Series]:
+    """Vectorized EncounterModel over a legacy appointments frame"""
+    legacy_id = _column(df, 'legacy_id')
+    patient_id = _column(df, 'patient_id')
+    appointment_date = _column(df, 'appointment_date')
+    provider_name = _column(df, 'provider_name')
+    location = _column(df, 'location')
+
+    appointment_values = _local_datetime_column(appointment_date)
+    status_values = _status_column(_column(df, 'status'), ENCOUNTER_STATUS_MAP)
+
+    valid = (
+        _integral_mask(legacy_id)
+        & _integral_mask(patient_id)
+        & _uuid_not_supplied(df, 'encounter_uuid')
+        & _uuid_not_supplied(df, 'patient_uuid')
+        & appointment_values.notna()
+        & _str_mask(provider_name)
+        & _str_mask(location)
+        & status_values.notna()
+    )
+
+    rows = pd.DataFrame({
+        'encounter_uuid': _uuid_column('encounter', legacy_id[valid]),
+        'patient_uuid': _uuid_column('patient', patient_id[valid]),
+        'encounter_ts_utc': appointment_values[valid],
+        'provider_name': provider_name[valid],
+        'location': location[valid],
+        'status': status_values[valid],
+        'legacy_id': legacy_id[valid].astype('int64'),
+        'patient_legacy_id': patient_id[valid].astype('int64'),
+    })
+    return rows, valid
+
+def validate_invoices_frame(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.Series]:
+    """Vectorized InvoiceModel over a legacy invoices frame"""
+    legacy_id = _column(df, 'legacy_id')
+    patient_id = _column(df, 'patient_id')
+    amount_usd = _column(df, 'amount_usd')
+    issued_date = _column(df, 'issued_date')
+    paid_date = _column(df, 'paid_date')
+
+    # Only plain numeric amounts are converted here; strings etc. go to the model
+    if pd.api.types.is_numeric_dtype(amount_usd.dtype) and not pd.api.types.is_bool_dtype(amount_usd.dtype):
+        amount_ok = amount_usd.notna() & (amount_usd.abs() < 1e15)
+    else:
+        amount_ok = pd.Series(False, index=df.index)
+
+    issued_values = _local_datetime_column(issued_date)
+    paid_blank = _null_or_empty_mask(paid_date)
+    paid_values = _local_datetime_column(paid_date)
+    status_values = _status_column(_column(df, 'status'), INVOICE_STATUS_MAP)
+
+    valid = (
+        _integral_mask(legacy_id)
+        & _integral_mask(patient_id)
+        & _uuid_not_supplied(df, 'invoice_uuid')
+        & _uuid_not_supplied(df, 'patient_uuid')
+        & amount_ok
+        & status_values.notna()
+        & issued_values.notna()
+        & (paid_blank | paid_values.notna())
+    )
+
+    rows = pd.DataFrame({
+        'invoice_uuid': _uuid_column('invoice', legacy_id[valid]),
+        'patient_uuid': _uuid_column('patient', patient_id[valid]),
+        # Dollars to cents, rounding half to even like the model's round()
+        'invoice_total_cents': (amount_usd[valid].astype('float64') * 100).round().astype('int64'),
+        'status': status_values[valid],
+        'issued_date_utc': issued_values[valid],
+        'paid_date_utc': paid_values[valid],
+        'legacy_id': legacy_id[valid].astype('int64'),
+        'patient_legacy_id': patient_id[valid].astype('int64'),
+    })
+    return rows, valid
 
- 
\ No newline at end of file
+# Vectorized validator for each model
+FRAME_VALIDATORS = {
+    PatientModel: validate_patients_frame,
+    EncounterModel: validate_encounters_frame,
+    InvoiceModel: validate_invoices_frame,
+}
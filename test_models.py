@@ -3,86 +3,138 @@
 Unit tests for Pydantic models
 """
 
+import re
 import unittest
 from datetime import datetime, date
 from zoneinfo import ZoneInfo
-from pydantic import ValidationError
+import pandas as pd
+from pydantic import TypeAdapter, ValidationError
 
-from models import PatientModel, EncounterModel, InvoiceModel
+from models import PatientModel, EncounterModel, InvoiceModel, FRAME_VALIDATORS, normalize_phone_e164
+from main import apply_target_dtypes
+
+UTC = ZoneInfo('UTC')
+
+# Deterministic UUIDs are stored as 32 lowercase hex characters
+_HEX32 = re.compile(r'\A[0-9a-f]{32}\Z')
+
+# Validates a whole list of patient records in one pydantic-core call
+_PATIENT_LIST_ADAPTER = TypeAdapter(list[PatientModel])
+
+# Phone formats that should convert successfully: (input, expected E.164)
+VALID_PHONE_CASES = (
+    ('(818) 555-1234', '+18185551234'),
+    ('818-555-1234', '+18185551234'),
+    ('818.555.1234', '+18185551234'),
+    ('8185551234', '+18185551234'),
+    ('', None),  # blank should become None
+    (None, None)  # None should stay None
+)
+
+# Phone numbers that should be rejected
+INVALID_PHONES = (
+    '(555) 123-4567',  # Invalid area code
+    'invalid',         # Invalid format
+    '(011) 123-4567',  # International prefix
+    '(960) 123-4567'   # Unassigned area code
+)
+
+VALID_EMAILS = (
+    'john@example.com',
+    'JOHN.DOE@EXAMPLE.COM',  # should be converted to lowercase
+    'user.name+tag@domain.co.uk',
+    'test123@test-domain.org'
+)
+
+INVALID_EMAILS = (
+    'userexample.com',      # missing @
+    'user@@example.com',    # double @
+    'user@',                # missing domain
+    '@example.com',         # missing username
+    '',                     # empty string
+    'user@domain',          # missing TLD
+    'user name@example.com' # space in username
+)
 
 
 class TestPatientModel(unittest.TestCase):
     
-    def test_valid_patient(self):
-        """Test valid patient data"""
-        patient_data = {
+    @classmethod
+    def setUpClass(cls):
+        # Shared valid patient; each case overrides the field under test
+        cls.BASE_PATIENT = {
             'legacy_id': 1,
             'first_name': 'John',
             'last_name': 'Doe',
             'dob': '1990-01-15',
-            'phone': '(818) 555-1234',  
-            'email': 'JOHN.DOE@EXAMPLE.COM',
+            'phone': '(818) 555-1234',
+            'email': 'john@example.com',
             'created_at': '2022-01-01 10:30'
         }
+        # Valid patient built once for the read-only attribute assertions
+        cls.patient = PatientModel(**{**cls.BASE_PATIENT, 'email': 'JOHN.DOE@EXAMPLE.COM'})
+    
+    def test_valid_patient(self):
+        """Test valid patient data"""
+        patient = self.patient
         
-        patient = PatientModel(**patient_data)
-        
-        self.assertEqual(patient.legacy_id, 1)
-        self.assertEqual(patient.first_name, 'John')
-        self.assertEqual(patient.dob, date(1990, 1, 15))
-        self.assertEqual(patient.phone_e164, '+18185551234')  # E.164 format with valid phone number
-        self.assertEqual(patient.email, 'john.doe@example.com')  # lowercase
+        expected = {
+            'legacy_id': 1,
+            'first_name': 'John',
+            'dob': date(1990, 1, 15),
+            'phone_e164': '+18185551234',  # E.164 format with valid phone number
+            'email': 'john.doe@example.com',  # lowercase
+        }
+        self.assertEqual(patient.model_dump(include=expected.keys()), expected)
         
         # Check timezone conversion
-        self.assertEqual(patient.created_at.tzinfo, ZoneInfo('UTC'))
+        self.assertEqual(patient.created_at.tzinfo, UTC)
         
         # Check UUID generation
-        self.assertIsInstance(patient.patient_uuid, str)
-        self.assertEqual(len(patient.patient_uuid), 32)  # hex format
-    
-    def test_phone_number_formats(self):
-        """Test various phone number formats - valid ones should convert, invalid ones should raise ValidationError"""
-        # Test valid phone formats that should convert successfully
-        valid_test_cases = [
-            ('(818) 555-1234', '+18185551234'),
-            ('818-555-1234', '+18185551234'),
-            ('818.555.1234', '+18185551234'),
-            ('8185551234', '+18185551234'),
-            ('', None),  # blank should become None
-            (None, None)  # None should stay None
-        ]
-        
-        base_data = {
+        self.assertRegex(patient.patient_uuid, _HEX32)
+
+    def test_model_validate_generates_uuid(self):
+        """Test model_validate assigns the same deterministic UUID as the constructor"""
+        patient_data = {
             'legacy_id': 1,
             'first_name': 'John',
             'last_name': 'Doe',
             'dob': '1990-01-15',
+            'phone': '(818) 555-1234',
             'email': 'john@example.com',
             'created_at': '2022-01-01 10:30'
         }
+
+        validated = PatientModel.model_validate(patient_data)
+        constructed = PatientModel(**patient_data)
+
+        self.assertRegex(validated.patient_uuid, _HEX32)
+        self.assertEqual(validated.patient_uuid, constructed.patient_uuid)
+        self.assertNotIn('patient_uuid', patient_data)  # input dict is not mutated
+
+    def test_phone_number_formats(self):
+        """Test various phone number formats - valid ones should convert, invalid ones should raise ValidationError"""
+        # Test valid phone formats against the phone normalizer directly
+        for input_phone, expected in VALID_PHONE_CASES:
+            with self.subTest(phone=input_phone):
+                self.assertEqual(normalize_phone_e164(input_phone), expected, f"Failed for input: {input_phone}")
         
-        # Test valid phone numbers
-        for input_phone, expected in valid_test_cases:
-            patient_data = base_data.copy()
-            patient_data['phone'] = input_phone
-            
-            patient = PatientModel(**patient_data)
-            self.assertEqual(patient.phone_e164, expected, f"Failed for input: {input_phone}")
+        # Test invalid phone numbers that should be rejected
+        for invalid_phone in INVALID_PHONES:
+            with self.subTest(phone=invalid_phone):
+                with self.assertRaises(ValueError, msg=f"Should have failed for: {invalid_phone}"):
+                    normalize_phone_e164(invalid_phone)
         
-        # Test invalid phone numbers that should raise ValidationError
-        invalid_phones = [
-            '(555) 123-4567',  # Invalid area code
-            'invalid',         # Invalid format
-            '(011) 123-4567',  # International prefix
-            '(960) 123-4567'   # Unassigned area code
-        ]
+        # End-to-end: the model applies the normalizer (all valid cases in one batch) and surfaces its errors
+        rows = [{**self.BASE_PATIENT, 'phone': input_phone} for input_phone, _ in VALID_PHONE_CASES]
+        patients = _PATIENT_LIST_ADAPTER.validate_python(rows)
+        for patient, (input_phone, expected) in zip(patients, VALID_PHONE_CASES):
+            with self.subTest(phone=input_phone, model=True):
+                self.assertEqual(patient.phone_e164, expected, f"Failed for input: {input_phone}")
         
-        for invalid_phone in invalid_phones:
-            patient_data = base_data.copy()
-            patient_data['phone'] = invalid_phone
-            
-            with self.assertRaises(ValidationError, msg=f"Should have failed for: {invalid_phone}"):
-                PatientModel(**patient_data)
+        patient_data = {**self.BASE_PATIENT, 'phone': INVALID_PHONES[0]}
+        with self.assertRaises(ValidationError, msg=f"Should have failed for: {INVALID_PHONES[0]}"):
+            PatientModel(**patient_data)
     
     def test_invalid_date(self):
         """Test invalid date handling - should raise validation error"""
@@ -116,54 +168,29 @@ class TestPatientModel(unittest.TestCase):
     
     def test_email_validation(self):
         """Test email validation - valid emails should pass, invalid ones should raise ValidationError"""
-        base_data = {
-            'legacy_id': 1,
-            'first_name': 'John',
-            'last_name': 'Doe',
-            'dob': '1990-01-15',
-            'phone': '(818) 555-1234',
-            'created_at': '2022-01-01 10:30'
-        }
-        
         # Test valid emails
-        valid_emails = [
-            'john@example.com',
-            'JOHN.DOE@EXAMPLE.COM',  # should be converted to lowercase
-            'user.name+tag@domain.co.uk',
-            'test123@test-domain.org'
-        ]
-        
-        for email in valid_emails:
-            patient_data = base_data.copy()
-            patient_data['email'] = email
-            
-            patient = PatientModel(**patient_data)
-            self.assertEqual(patient.email, email.lower(), f"Failed for email: {email}")
+        for email in VALID_EMAILS:
+            with self.subTest(email=email):
+                patient_data = {**self.BASE_PATIENT, 'email': email}
+                
+                patient = PatientModel(**patient_data)
+                self.assertEqual(patient.email, email.lower(), f"Failed for email: {email}")
         
         # Test invalid emails that should raise ValidationError
-        invalid_emails = [
-            'userexample.com',      # missing @
-            'user@@example.com',    # double @
-            'user@',                # missing domain
-            '@example.com',         # missing username
-            '',                     # empty string
-            'user@domain',          # missing TLD
-            'user name@example.com' # space in username
-        ]
-        
-        for invalid_email in invalid_emails:
-            patient_data = base_data.copy()
-            patient_data['email'] = invalid_email
-            
-            with self.assertRaises(ValidationError, msg=f"Should have failed for: {invalid_email}"):
-                PatientModel(**patient_data)
+        for invalid_email in INVALID_EMAILS:
+            with self.subTest(email=invalid_email):
+                patient_data = {**self.BASE_PATIENT, 'email': invalid_email}
+                
+                with self.assertRaises(ValidationError, msg=f"Should have failed for: {invalid_email}"):
+                    PatientModel(**patient_data)
 
 
 class TestEncounterModel(unittest.TestCase):
     
-    def test_valid_appointment(self):
-        """Test valid appointment data"""
-        appointment_data = {
+    @classmethod
+    def setUpClass(cls):
+        # Shared valid appointment; each case overrides the field under test
+        cls.BASE_APPOINTMENT = {
             'legacy_id': 1,
             'patient_id': 123,
             'patient_uuid': b'1234567890123456',  # Added required patient_uuid as bytes
@@ -172,19 +199,25 @@ class TestEncounterModel(unittest.TestCase):
             'location': 'Main Clinic',
             'status': 'SCHEDULED'
         }
+        # Valid appointment built once for the read-only attribute assertions
+        cls.appointment = EncounterModel(**cls.BASE_APPOINTMENT)
+    
+    def test_valid_appointment(self):
+        """Test valid appointment data"""
+        appointment = self.appointment
         
-        appointment = EncounterModel(**appointment_data)
-        
-        self.assertEqual(appointment.legacy_id, 1)
-        self.assertEqual(appointment.patient_legacy_id, 123)  # corrected field name
-        self.assertEqual(appointment.status, 'scheduled')  # mapped to lowercase
+        expected = {
+            'legacy_id': 1,
+            'patient_legacy_id': 123,  # corrected field name
+            'status': 'scheduled',  # mapped to lowercase
+        }
+        self.assertEqual(appointment.model_dump(include=expected.keys()), expected)
         
         # Check timezone conversion
-        self.assertEqual(appointment.encounter_ts_utc.tzinfo, ZoneInfo('UTC'))  # corrected field name
+        self.assertEqual(appointment.encounter_ts_utc.tzinfo, UTC)  # corrected field name
         
         # Check UUID generation
-        self.assertIsInstance(appointment.encounter_uuid, str)
-        self.assertEqual(len(appointment.encounter_uuid), 32)  # hex format
+        self.assertRegex(appointment.encounter_uuid, _HEX32)
     
     def test_status_mapping(self):
         """Test status value mapping per requirements - only valid statuses accepted"""
@@ -198,80 +231,81 @@ class TestEncounterModel(unittest.TestCase):
             ('completed', 'completed')   # already lowercase
         ]
         
-        base_data = {
-            'legacy_id': 1,
-            'patient_id': 123,
-            'patient_uuid': b'1234567890123456',  # Added required patient_uuid as bytes
-            'appointment_date': '2023-01-15 14:30',
-            'provider_name': 'Dr. Smith',
-            'location': 'Main Clinic'
-        }
-        
         # Test valid statuses
         for input_status, expected in valid_test_cases:
-            appointment_data = base_data.copy()
-            appointment_data['status'] = input_status
-            
-            appointment = EncounterModel(**appointment_data)
-            self.assertEqual(appointment.status, expected, f"Failed for status: {input_status}")
+            with self.subTest(status=input_status):
+                appointment_data = {**self.BASE_APPOINTMENT, 'status': input_status}
+                
+                appointment = EncounterModel(**appointment_data)
+                self.assertEqual(appointment.status, expected, f"Failed for status: {input_status}")
         
         # Test invalid statuses that should raise ValidationError
         invalid_statuses = ['unknown_status', 'INVALID', 'pending', 'COMPLE']
         
         for invalid_status in invalid_statuses:
-            appointment_data = base_data.copy()
-            appointment_data['status'] = invalid_status
-            
-            with self.assertRaises(ValidationError, msg=f"Should have failed for: {invalid_status}"):
-                EncounterModel(**appointment_data)
+            with self.subTest(status=invalid_status):
+                appointment_data = {**self.BASE_APPOINTMENT, 'status': invalid_status}
+                
+                with self.assertRaises(ValidationError, msg=f"Should have failed for: {invalid_status}"):
+                    EncounterModel(**appointment_data)
 
 
 class TestInvoiceModel(unittest.TestCase):
     
-    def test_valid_invoice_paid(self):
-        """Test valid paid invoice"""
-        invoice_data = {
+    @classmethod
+    def setUpClass(cls):
+        # Shared valid invoice; each case overrides the field under test
+        cls.BASE_INVOICE = {
             'legacy_id': 1,
             'patient_id': 123,
             'patient_uuid': b'1234567890123456',  # Added required patient_uuid as bytes
+            'amount_usd': 100.0,
+            'status': 'OPEN',
+            'issued_date': '2023-01-15 10:00',
+            'paid_date': None
+        }
+        # Valid paid and open invoices built once for the read-only attribute assertions
+        cls.paid_invoice = InvoiceModel(**{
+            **cls.BASE_INVOICE,
             'amount_usd': 150.75,
             'status': 'PAID',
-            'issued_date': '2023-01-15 10:00',
             'paid_date': '2023-01-20 15:30'
-        }
-        
-        invoice = InvoiceModel(**invoice_data)
+        })
+        cls.open_invoice = InvoiceModel(**{
+            **cls.BASE_INVOICE,
+            'amount_usd': 75.50,
+            'paid_date': ''  # empty string should become None
+        })
+    
+    def test_valid_invoice_paid(self):
+        """Test valid paid invoice"""
+        invoice = self.paid_invoice
         
-        self.assertEqual(invoice.legacy_id, 1)
-        self.assertEqual(invoice.invoice_total_cents, 15075)  # corrected field name and value (cents)
-        self.assertEqual(invoice.status, 'paid')  # mapped to lowercase
+        expected = {
+            'legacy_id': 1,
+            'invoice_total_cents': 15075,  # corrected field name and value (cents)
+            'status': 'paid',  # mapped to lowercase
+        }
+        self.assertEqual(invoice.model_dump(include=expected.keys()), expected)
         self.assertIsNotNone(invoice.paid_date_utc)  # corrected field name
         
         # Check timezone conversion
-        self.assertEqual(invoice.issued_date_utc.tzinfo, ZoneInfo('UTC'))  # corrected field name
-        self.assertEqual(invoice.paid_date_utc.tzinfo, ZoneInfo('UTC'))  # corrected field name
+        self.assertEqual(invoice.issued_date_utc.tzinfo, UTC)  # corrected field name
+        self.assertEqual(invoice.paid_date_utc.tzinfo, UTC)  # corrected field name
         
         # Check UUID generation
-        self.assertIsInstance(invoice.invoice_uuid, str)
-        self.assertEqual(len(invoice.invoice_uuid), 32)  # hex format
+        self.assertRegex(invoice.invoice_uuid, _HEX32)
     
     def test_valid_invoice_open(self):
         """Test valid open invoice with no paid date"""
-        invoice_data = {
-            'legacy_id': 1,
-            'patient_id': 123,
-            'patient_uuid': b'1234567890123456',  # Added required patient_uuid as bytes
-            'amount_usd': 75.50,
-            'status': 'OPEN',
-            'issued_date': '2023-01-15 10:00',
-            'paid_date': ''  # empty string should become None
-        }
+        invoice = self.open_invoice
         
-        invoice = InvoiceModel(**invoice_data)
-        
-        self.assertEqual(invoice.status, 'open')  # mapped to lowercase
-        self.assertIsNone(invoice.paid_date_utc)  # corrected field name
-        self.assertEqual(invoice.invoice_total_cents, 7550)  # corrected field name and value (cents)
+        expected = {
+            'status': 'open',  # mapped to lowercase
+            'paid_date_utc': None,  # corrected field name
+            'invoice_total_cents': 7550,  # corrected field name and value (cents)
+        }
+        self.assertEqual(invoice.model_dump(include=expected.keys()), expected)
     
     def test_status_mapping(self):
         """Test invoice status mapping per requirements"""
@@ -281,21 +315,137 @@ class TestInvoiceModel(unittest.TestCase):
             ('open', 'open'),  # already lowercase
         ]
         
-        base_data = {
-            'legacy_id': 1,
-            'patient_id': 123,
-            'patient_uuid': b'1234567890123456',  # Added required patient_uuid as bytes
-            'amount_usd': 100.0,
-            'issued_date': '2023-01-15 10:00',
-            'paid_date': None
-        }
-        
         for input_status, expected in test_cases:
-            invoice_data = base_data.copy()
-            invoice_data['status'] = input_status
+            with self.subTest(status=input_status):
+                invoice_data = {**self.BASE_INVOICE, 'status': input_status}
+                
+                invoice = InvoiceModel(**invoice_data)
+                self.assertEqual(invoice.status, expected, f"Failed for status: {input_status}")
+
+
+class TestFrameValidators(unittest.TestCase):
+    """Vectorized frame validators must agree with the models row for row"""
+
+    def assert_matches_models(self, df, model_class):
+        rows, valid = FRAME_VALIDATORS[model_class](df)
+        vectorized = iter(rows.to_dict(orient="records"))
+        
+        for position, row_dict in enumerate(df.to_dict(orient="records")):
+            try:
+                expected = model_class.model_validate(row_dict).model_dump()
+            except ValidationError:
+                expected = None
             
-            invoice = InvoiceModel(**invoice_data)
-            self.assertEqual(invoice.status, expected, f"Failed for status: {input_status}")
+            if not valid.iloc[position]:
+                continue  # rejected rows are re-validated by the model itself
+            
+            record = next(vectorized)
+            self.assertIsNotNone(expected, f"Accepted a row the model rejects: {row_dict}")
+            self.assertEqual(list(record), list(expected))
+            self.assertEqual(record, expected, f"Mismatch for row: {row_dict}")
+            self.assertEqual(
+                [type(v) for v in record.values()], [type(v) for v in expected.values()]
+            )
+    
+    def test_patients_frame(self):
+        """Test patients frame, including blank/invalid phones, emails and dates"""
+        df = pd.DataFrame({
+            'legacy_id': [1, 2, 3, 4, 5, 6],
+            'first_name': ['John', 'Jane', None, 'Mary', 'Bob', 'Ann'],
+            'last_name': ['Doe'] * 6,
+            'dob': ['1990-01-15', '1985-07-04', '1990-01-15', 'invalid-date', '2001-02-03', '1970-12-31'],
+            'phone': ['(818) 555-1234', '', '818.555.1234', None, '(555) 123-4567', 'nan'],
+            'email': [' JOHN.DOE@EXAMPLE.COM ', 'jane@example.com', 'x@example.com', 'mary@example.com',
+                      'bob@example.com', 'ann@domain'],
+            # accepted rows cover a DST-ambiguous and a DST-nonexistent local time
+            'created_at': ['2022-11-06 01:30', '2022-03-13 02:30', '2022-01-01 10:30',
+                           '2022-01-01 10:30', '2022-01-01 10:30', '2022-01-01 10:30']
+        })
+        
+        rows, valid = FRAME_VALIDATORS[PatientModel](df)
+        
+        self.assertEqual(valid.tolist(), [True, True, False, False, False, False])
+        self.assertEqual(
+            rows['created_at'].tolist(),
+            [datetime(2022, 11, 6, 5, 30, tzinfo=UTC), datetime(2022, 3, 13, 7, 30, tzinfo=UTC)]
+        )
+        self.assert_matches_models(df, PatientModel)
+    
+    def test_encounters_frame(self):
+        """Test appointments frame, including status mapping and bad timestamps"""
+        df = pd.DataFrame({
+            'legacy_id': [1, 2, 3, 4, 5, 6, 7, 8, 9],
+            'patient_id': [123, 123, 456, 789, 123, 123, 123, 123, 123],
+            # rows 5-9 sit on either side of the range the frame path localizes itself
+            'appointment_date': ['2023-01-15 14:30', '2023-06-01 09:00', '', '2023-01-15 14:30',
+                                 '1678-01-01 00:00', '9999-12-30 23:59',
+                                 '1000-06-01 00:00', '0001-01-01 00:00', '9999-12-31 20:00'],
+            'provider_name': ['Dr. Smith'] * 9,
+            'location': ['Main Clinic'] * 9,
+            'status': ['SCHEDULED', ' completed ', 'CANCELLED', 'pending'] + ['SCHEDULED'] * 5
+        })
+        
+        rows, valid = FRAME_VALIDATORS[EncounterModel](df)
+        
+        self.assertEqual(valid.tolist(), [True, True, False, False, True, True, False, False, False])
+        self.assert_matches_models(df, EncounterModel)
+        
+        # Out-of-range local times are left to the model, which applies New York LMT
+        appointment = EncounterModel(**df.iloc[6].to_dict())
+        self.assertEqual(appointment.encounter_ts_utc, datetime(1000, 6, 1, 4, 56, 2, tzinfo=UTC))
+    
+    def test_invoices_frame(self):
+        """Test invoices frame, including cents rounding and blank paid dates"""
+        df = pd.DataFrame({
+            'legacy_id': [1, 2, 3, 4],
+            'patient_id': [123, 123, 456, 789],
+            'amount_usd': [150.75, 0.125, 2.675, None],
+            'status': ['PAID', 'open', 'OPEN', 'PAID'],
+            'issued_date': ['2023-01-15 10:00', '2023-01-15 10:00', '2023-01-15 10:00', '2023-01-15 10:00'],
+            'paid_date': ['2023-01-20 15:30', '', None, '2023-01-20 15:30']
+        })
+        
+        rows, valid = FRAME_VALIDATORS[InvoiceModel](df)
+        
+        self.assertEqual(valid.tolist(), [True, True, True, False])
+        self.assert_matches_models(df, InvoiceModel)
+
+
+class TestTargetDtypes(unittest.TestCase):
+    """Target dtype casts must accept every date the models accept"""
+
+    def test_out_of_nanosecond_range_dates(self):
+        """Test a pre-1677 dob and a post-2262 timestamp survive the reconciliation casts"""
+        patients = pd.DataFrame({
+            'legacy_id': [1, 2],
+            'first_name': ['John', 'Jane'],
+            'last_name': ['Doe', 'Doe'],
+            'dob': ['1650-03-01', '0190-01-15'],
+            'phone': ['(818) 555-1234', ''],
+            'email': ['john@example.com', 'jane@example.com'],
+            'created_at': ['2022-01-01 10:30', '2022-01-01 10:30']
+        })
+        rows, valid = FRAME_VALIDATORS[PatientModel](patients)
+        self.assertEqual(valid.tolist(), [True, True])
+        
+        patients_target = apply_target_dtypes(rows, 'patients')
+        self.assertEqual(patients_target['dob'].tolist(), [date(1650, 3, 1), date(190, 1, 15)])
+        
+        appointments = pd.DataFrame({
+            'legacy_id': [1],
+            'patient_id': [123],
+            'appointment_date': ['2300-01-15 14:30'],
+            'provider_name': ['Dr. Smith'],
+            'location': ['Main Clinic'],
+            'status': ['SCHEDULED']
+        })
+        rows, valid = FRAME_VALIDATORS[EncounterModel](appointments)
+        self.assertEqual(valid.tolist(), [True])
+        
+        encounters_target = apply_target_dtypes(rows, 'encounters')
+        self.assertEqual(
+            encounters_target['encounter_ts_utc'].iloc[0], pd.Timestamp('2300-01-15 19:30', tz='UTC')
+        )
 
 
 if __name__ == '__main__':